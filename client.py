@@ -1,55 +1,201 @@
-from langchain_ollama import OllamaLLM
-from langchain.agents import Tool, initialize_agent
+from langchain_core.globals import set_llm_cache
+from langchain_ollama import ChatOllama
+from langchain_core.tools import BaseTool, StructuredTool
 from langgraph.prebuilt import create_react_agent
-from fastmcp import Client
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import functools
+from typing import Any
 
-from utils.constants import MCP_SERVER_URL, OLLAMA_BASE_URL
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+from utils.constants import (
+    LLM_CACHE_PATH,
+    MCP_SERVER_URL,
+    OLLAMA_BASE_URL,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_MODEL,
+    OLLAMA_NUM_CTX,
+    TOOL_CACHE_MAXSIZE,
+    TOOL_CACHE_TTL,
+    TOOL_CATALOG_TTL,
+    TOOL_EXECUTOR_WORKERS,
+)
+from utils.json_codec import loads
+from utils.mcp_pool import MCPSessionPool
+from utils.tool_catalog import list_tools_cached
+from utils.tool_cache import ToolResultCache, make_key
+
+# Native tool calling needs a chat model with tool support (plain llama3 has none in Ollama).
+# One instance is reused for every step, and keep_alive keeps the model resident between them.
+llm = ChatOllama(
+    model=OLLAMA_MODEL,
+    base_url=OLLAMA_BASE_URL,
+    keep_alive=OLLAMA_KEEP_ALIVE,
+    num_ctx=OLLAMA_NUM_CTX,
+)
+if LLM_CACHE_PATH:
+    from langchain_community.cache import SQLiteCache
+
+    # Repeated steps with a byte-identical prompt are answered without calling the model.
+    set_llm_cache(SQLiteCache(database_path=LLM_CACHE_PATH))
+
+# Kept fixed and first in every request so Ollama can reuse the KV cache for this prefix
+# (and the tool schemas sent with it) instead of re-reading it on every ReAct step.
+SYSTEM_PROMPT = (
+    "You are an assistant for a BotCity Maestro workspace. Use the available tools to look up "
+    "tasks and other workspace data instead of guessing. When several independent lookups are "
+    "needed, make them in one step with multi_tool_call."
+)
+# One initialized MCP session per server, shared by every tool wrapper.
+mcp_pool = MCPSessionPool()
+# Results of read-only tools, reused while the agent repeats the same call.
+tool_cache = ToolResultCache(maxsize=TOOL_CACHE_MAXSIZE, ttl=TOOL_CACHE_TTL)
+# Bounded default executor for the blocking work LangChain offloads from the event loop.
+executor = ThreadPoolExecutor(max_workers=TOOL_EXECUTOR_WORKERS, thread_name_prefix="mcp-tool")
+
+
+async def _call(mcp, tool_name, cacheable, args):
+    """Tool coroutine: run `tool_name` with the `args` dict on the shared MCP session.
+
+    Results of read-only tools are cached on their arguments.
+    """
+    if not cacheable:
+        return await mcp.call_tool(tool_name, args)
+
+    key = make_key(tool_name, args)
+    hit, cached = tool_cache.get(key)
+    if hit:
+        return cached
+    result = await mcp.call_tool(tool_name, args)
+    tool_cache.set(key, result)
+    return result
+
+
+def _run_on_loop(loop, coro):
+    """Sync tool entry point: run `coro` on `loop` (which owns the MCP session) and wait for it."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        # Blocking here would stop the loop the call has to run on.
+        coro.close()
+        raise RuntimeError("A sync tool call cannot wait on its own event loop; use ainvoke().")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+class MCPTool(BaseTool):
+    """Agent-facing proxy for one MCP tool; calls go straight to the shared session."""
+
+    mcp: Any
+    loop: Any
+    cacheable: bool = False
+
+    # `self` is positional-only so that a tool argument of any name lands in kwargs.
+    def _run(self, /, **kwargs):
+        return _run_on_loop(self.loop, self._arun(**kwargs))
+
+    async def _arun(self, /, **kwargs):
+        return await _call(self.mcp, self.name, self.cacheable, kwargs)
+
+
+async def batched_call_tool(mcp, calls):
+    """Run several (tool_name, args) calls concurrently over one MCP session.
+
+    Results come back in the same order as `calls`; a failing call yields its
+    exception instead of aborting the others.
+    """
+    return await asyncio.gather(
+        *(mcp.call_tool(name, args) for name, args in calls),
+        return_exceptions=True,
+    )
+
+
+MULTI_TOOL_DESCRIPTION = (
+    "Run several independent tools at once. `calls` is a list such as "
+    '[{"name": "<tool name>", "args": {}}, ...]; returns the results in the same order.'
+)
+
+MULTI_TOOL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "calls": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "args": {"type": "object"}},
+                "required": ["name"],
+            },
+        },
+    },
+    "required": ["calls"],
+}
+
+
+async def _multi_call(mcp, cacheable_tools, calls):
+    """Coroutine for the multi_tool_call tool: run a list of calls concurrently."""
+    try:
+        calls = loads(calls) if isinstance(calls, str) else calls
+        calls = [(c["name"], c.get("args") or {}) for c in calls]
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return "Invalid input: " + MULTI_TOOL_DESCRIPTION
+
+    # Each call goes through _call, so read-only results are cached as for a single call.
+    results = await asyncio.gather(
+        *(_call(mcp, name, name in cacheable_tools, args) for name, args in calls),
+        return_exceptions=True,
+    )
+    return [
+        f"Error from {name}: {result}" if isinstance(result, BaseException) else result
+        for (name, _), result in zip(calls, results)
+    ]
 
-llm = OllamaLLM(model="llama3", base_url=OLLAMA_BASE_URL)
 
 async def main():
-    mcp = Client(MCP_SERVER_URL)
-    async with mcp:
-        tools = await mcp.list_tools()
-
-        agent_tools = []
-        # Create per-tool synchronous wrappers (they will run the async call inside a fresh event loop)
-        for t in tools:
-            def _tool_sync(*args, _tool_name=t.name, **kwargs):
-                # Normalize input into a dict to pass to mcp.call_tool
-                if args and not kwargs:
-                    if len(args) == 1:
-                        payload = args[0]
-                        # If the agent returned a placeholder meaning "no input needed",
-                        # treat it as empty args (don't send an 'input' key that the tool
-                        # doesn't expect).
-                        if isinstance(payload, str):
-                            s = payload.strip().lower()
-                            if s in ("", "none", "n/a") or "don't need" in s or "do not need" in s or s.startswith("none"):
-                                args_dict = {}
-                            else:
-                                args_dict = {"input": payload}
-                        elif isinstance(payload, dict):
-                            args_dict = payload
-                        else:
-                            args_dict = {"arg": payload}
-                    else:
-                        args_dict = {"args": list(args)}
-                else:
-                    args_dict = kwargs or {}
-
-                # Run the async MCP call in a fresh event loop (safe inside a worker thread)
-                return asyncio.run(mcp.call_tool(_tool_name, args_dict))
-
-            agent_tools.append(Tool(name=t.name, func=_tool_sync, description=t.description))
-
-        agent = initialize_agent(llm=llm, tools=agent_tools, agent_type="zero-shot-react-description", verbose=True)
+    mcp = await mcp_pool.get(MCP_SERVER_URL)
+    try:
+        tools = await list_tools_cached(mcp, MCP_SERVER_URL, TOOL_CATALOG_TTL)
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(executor)
+
+        # One proxy per MCP tool. Only tools the server marks as read-only are safe to serve
+        # from the cache. The tool name is a field, so an agent-supplied kwarg can't replace it.
+        agent_tools = [
+            MCPTool(
+                name=t.name,
+                description=t.description or "",
+                args_schema=t.input_schema,
+                mcp=mcp,
+                loop=loop,
+                cacheable=bool(t.annotations and t.annotations.read_only_hint),
+            )
+            for t in tools
+        ]
+        cacheable_tools = frozenset(tool.name for tool in agent_tools if tool.cacheable)
+
+        # Lets the agent fan out independent calls in one step instead of one tool per step.
+        multi_call = functools.partial(_multi_call, mcp, cacheable_tools)
+        agent_tools.append(StructuredTool(
+            name="multi_tool_call",
+            description=MULTI_TOOL_DESCRIPTION,
+            args_schema=MULTI_TOOL_SCHEMA,
+            func=lambda calls: _run_on_loop(loop, multi_call(calls)),
+            coroutine=multi_call,
+        ))
+
+        agent = create_react_agent(llm, tools=agent_tools, prompt=SYSTEM_PROMPT)
 
         print("Invoking agent...")
-        # Run the (synchronous) agent.invoke in a thread so tool wrappers can use asyncio.run safely.
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, lambda: agent.invoke("Tell me the quantity of tasks that have succeeded"))
-        print("Agent result:\n", result)
+        result = await agent.ainvoke({"messages": [("user", "Tell me the quantity of tasks that have succeeded")]})
+        print("Agent result:\n", result["messages"][-1].content)
+    finally:
+        await mcp_pool.aclose()
 
-asyncio.run(main())
+if uvloop is not None:
+    uvloop.run(main())
+else:
+    asyncio.run(main())
@@ -1,3 +1,4 @@
 from .maestro_client import MaestroClient
+from .async_maestro_client import AsyncMaestroClient
 
-__all__ = ["MaestroClient"]
+__all__ = ["MaestroClient", "AsyncMaestroClient"]
\ No newline at end of file
@@ -0,0 +1,213 @@
+"""
+BotCity Maestro API – asyncio Client
+
+- Same resource helpers and MaestroResponse wrapper as MaestroClient
+- Built on one shared httpx.AsyncClient (connection pooling, HTTP/2 when `h2` is installed)
+- Compressed responses (gzip/deflate, br/zstd with brotli/zstandard installed) are negotiated and decoded by httpx
+- Intended for async servers (e.g. FastMCP tools) that must not block the event loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from typing import Any, Awaitable, Dict, Iterable, Mapping, Optional
+
+from utils.constants import HTTP2_AVAILABLE
+
+from .maestro_client import MaestroResponse, _BaseMaestroClient, _dump_json, _wrap_response
+
+
+class AsyncMaestroClient(_BaseMaestroClient):
+    """
+    Async BotCity Maestro API client. Every resource helper call returns an awaitable.
+
+    Typical usage:
+        client = AsyncMaestroClient(login="your_login", key="your_key")
+
+        tasks = await client.tasks.list()
+        resp = await client.request_raw("GET", "/api/v2/task", params={"size": 50})
+
+        # Release pooled connections on shutdown
+        await client.aclose()
+    """
+
+    def __init__(
+        self,
+        login: str,
+        key: str,
+        base_url: str = "https://developers.botcity.dev",
+        *,
+        request_timeout: float = 30.0,
+        token_skew: int = 10,
+        default_org_header: str = "X-Organization",
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+    ):
+        """
+        Arguments are documented on _BaseMaestroClient.__init__, plus:
+            max_connections: Upper bound of concurrent connections in the pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
+        """
+        super().__init__(
+            login,
+            key,
+            base_url,
+            request_timeout=request_timeout,
+            token_skew=token_skew,
+            default_org_header=default_org_header,
+            max_retries=max_retries,
+            backoff_base=backoff_base,
+            backoff_cap=backoff_cap,
+        )
+        self._lock = asyncio.Lock()
+
+        # One client for the process lifetime; auth headers live on it like on MaestroClient's session.
+        # retries= re-attempts failed connects (ConnectError/ConnectTimeout) inside the pool.
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            retries=3,
+        )
+        # No client-wide Content-Type: httpx sets it per body (JSON or multipart boundary).
+        self._http = httpx.AsyncClient(transport=transport, timeout=request_timeout)
+
+    def _http_headers(self) -> Mapping[str, str]:
+        return self._http.headers
+
+    def _set_http_headers(self, headers: Mapping[str, str]) -> None:
+        self._http.headers = headers
+
+    # --------
+    # Auth
+    # --------
+
+    async def authenticate(self) -> MaestroResponse:
+        """
+        Perform authentication against Maestro login route and cache token & organization.
+
+        Raises:
+            MaestroClientError on non-OK responses or malformed payloads.
+        """
+        url = self._login_url()
+        resp = await self._http.post(url, json=self._login_payload())
+        # No await between validation and assignment, so no lock is needed here.
+        data = self._store_login(resp)
+
+        return MaestroResponse(
+            ok=True,
+            status_code=resp.status_code,
+            url=url,
+            headers=resp.headers,
+            data=data,
+            raw=resp
+        )
+
+    async def refresh(self) -> MaestroResponse:
+        """Log in again now, serialized with the on-demand login of concurrent requests."""
+        async with self._lock:
+            return await self.authenticate()
+
+    async def _ensure_authenticated(self) -> None:
+        """Re-auth if token is absent/expired; concurrent callers share a single login."""
+        if self._is_token_valid():
+            return
+        async with self._lock:
+            if not self._is_token_valid():
+                await self.authenticate()
+
+    # ---------------
+    # Core requestor
+    # ---------------
+
+    async def request_raw(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry_on_401: bool = True,
+        stream: bool = False,
+    ) -> MaestroResponse:
+        """
+        Low-level request method; same arguments as MaestroClient.request_raw.
+
+        With stream=True the body is not read: `data` is None and the caller consumes
+        `raw.aiter_bytes()` and must `await raw.aclose()`.
+        """
+        method = method.upper()
+        url = self._normalize_url(path)
+        await self._ensure_authenticated()
+        token = self._token
+
+        # Serialize a JSON body once; retries and the 401 resend reuse the same bytes.
+        content = None
+        if json is not None and files is None and data is None:
+            content = _dump_json(json)
+            headers = {"Content-Type": "application/json", **(headers or {})}
+
+        async def send() -> httpx.Response:
+            request = self._http.build_request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                content=content,
+                files=files,
+                data=data,
+            )
+            return await self._http.send(request, stream=stream)
+
+        resp = await self._send_with_backoff(method, send)
+
+        # If unauthorized, try to refresh token once and retry.
+        if resp.status_code == 401 and retry_on_401:
+            await resp.aclose()
+            # Force a new token, unless a concurrent request already replaced the rejected one.
+            # No await between the check and the invalidation, so no lock is needed for it.
+            self._invalidate_token(token)
+            await self._ensure_authenticated()
+            resp = await self._send_with_backoff(method, send)
+
+        return _wrap_response(resp, stream=stream)
+
+    async def _send_with_backoff(self, method: str, send) -> httpx.Response:
+        """Await `send()` and retry transient failures, sleeping between attempts."""
+        resp = await send()
+        for attempt in range(self.max_retries):
+            if not self._should_retry(method, resp.status_code):
+                break
+            delay = self._retry_delay(attempt, resp)
+            await resp.aclose()
+            await asyncio.sleep(delay)
+            resp = await send()
+        return resp
+
+    # -------------
+    # Utilities
+    # -------------
+
+    def set_organization(self, organization: str) -> None:
+        """Manually override the cached organization header value."""
+        self._organization = organization
+        self._update_http_headers({self.org_header_name: organization})
+
+    async def gather(self, calls: Iterable[Awaitable[MaestroResponse]]) -> list[MaestroResponse]:
+        """Await several helper calls concurrently over the shared pool; results keep their order."""
+        return list(await asyncio.gather(*calls))
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client and its pooled connections."""
+        await self._http.aclose()
@@ -4,6 +4,7 @@ BotCity Maestro API – Python Client
 - Base URL: https://developers.botcity.dev
 - Single entry point: MaestroClient
 - Token caching + auto-refresh on 401
+- Pooled keep-alive connections via a shared requests.Session
 - Consistent response wrapper: MaestroResponse
 - Sub-APIs grouped by resource (Tasks, Logs, Automations, Bots, etc.)
 - All comments and docstrings in English.
@@ -13,12 +14,25 @@ Author: Oráculo's Assistant
 
 from __future__ import annotations
 
+import json
+import os
 import time
+import random
+import functools
 import threading
 import requests
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+from abc import ABC, abstractmethod
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union, Iterable
+from typing import Any, Dict, Mapping, Optional, Union, Iterable
 
 
 # -------------------------
@@ -29,7 +43,7 @@ class MaestroClientError(Exception):
     """Raised for client-side errors or non-OK responses from Maestro API."""
 
 
-@dataclass
+@dataclass(slots=True)
 class MaestroResponse:
     """
     Standardized response wrapper for Maestro API calls.
@@ -38,46 +52,35 @@ class MaestroResponse:
         ok: True if HTTP status is in 2xx.
         status_code: HTTP status code.
         url: Final URL that was called.
-        headers: Response headers.
+        headers: Response headers, as the case-insensitive mapping of the underlying response.
         data: Parsed JSON (dict/list) when possible; else raw bytes/text.
-        raw: The original requests.Response object (optional for deep inspection).
+        raw: The original requests.Response / httpx.Response (optional for deep inspection).
     """
     ok: bool
     status_code: int
     url: str
-    headers: Dict[str, str]
+    headers: Mapping[str, str]
     data: Any
-    raw: Optional[requests.Response] = None
+    raw: Optional[Any] = None
 
 
 # -------------
 # Core Client
 # -------------
 
-class MaestroClient:
-    """
-    BotCity Maestro API client with token caching and organized resource helpers.
-
-    Typical usage:
-        client = MaestroClient(
-            login="your_login",
-            key="your_key",
-            base_url="https://developers.botcity.dev"
-        )
-
-        # Authenticate (auto-called on first request if needed)
-        client.authenticate()
+# Transient statuses retried with backoff. 429/503 mean the request was not processed;
+# 502/504 may arrive after it was, so those are only retried for idempotent methods.
+_RETRY_ALWAYS = frozenset({429, 503})
+_RETRY_IDEMPOTENT = frozenset({502, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
 
-        # Use resource helpers
-        tasks = client.tasks.list(page=1, size=50)
-
-        # Or make arbitrary calls
-        resp = client.request_raw("GET", "/maestro/api/tasks", params={"page": 1, "size": 50})
+class _BaseMaestroClient(ABC):
+    """
+    State and helpers shared by MaestroClient and AsyncMaestroClient:
+    configuration, cached token & organization, URL resolution and resource helpers.
 
-    Notes:
-        - Token & organization are retrieved by POST /maestro/api/login
-        - All subsequent requests use Authorization: Bearer <token>
-          and the X-Organization (or Organization) header when required by backend.
+    Resource helpers only build paths and return whatever the client's request_raw
+    returns, so on the async client every helper call is awaitable.
     """
 
     def __init__(
@@ -88,7 +91,10 @@ class MaestroClient:
         *,
         request_timeout: float = 30.0,
         token_skew: int = 10,
-        default_org_header: str = "X-Organization"
+        default_org_header: str = "X-Organization",
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
     ):
         """
         Args:
@@ -98,6 +104,9 @@ class MaestroClient:
             request_timeout: Requests timeout in seconds.
             token_skew: Seconds to subtract from token expiry to avoid race conditions.
             default_org_header: Header name to send the organization value.
+            max_retries: Retries for 429/5xx responses (0 disables backoff retries).
+            backoff_base: Base delay in seconds for exponential backoff.
+            backoff_cap: Upper bound in seconds for a single backoff delay, Retry-After included.
         """
         self.base_url = base_url.rstrip("/")
         self.login_value = login
@@ -105,24 +114,16 @@ class MaestroClient:
         self.timeout = request_timeout
         self.token_skew = token_skew
         self.org_header_name = default_org_header
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
 
         self._token: Optional[str] = None
         self._organization: Optional[str] = None
         self._token_expires_at: float = 0.0
-        self._lock = threading.Lock()
-
-        # Resource helpers
-        self.tasks = _TasksAPI(self)
-        self.logs = _LogsAPI(self)
-        self.automations = _AutomationsAPI(self)
-        self.bots = _BotsAPI(self)
-        self.runners = _RunnersAPI(self)
-        self.credentials = _CredentialsAPI(self)
-        self.datapools = _DatapoolsAPI(self)
-        self.result_files = _ResultFilesAPI(self)
-        self.errors = _ErrorsAPI(self)
-        self.schedules = _SchedulesAPI(self)
-        self.workspaces = _WorkspacesAPI(self)
+
+        # base_url is fixed after __init__, so resolved URLs can be memoized per client.
+        self._normalize_url = functools.lru_cache(maxsize=256)(self._resolve_url)
 
     # --------
     # Auth
@@ -130,23 +131,31 @@ class MaestroClient:
 
     def _is_token_valid(self) -> bool:
         """Return True if we have a token and it hasn't expired considering skew."""
-        return bool(self._token) and (time.time() < (self._token_expires_at - self.token_skew))
+        return bool(self._token) and (time.monotonic() < (self._token_expires_at - self.token_skew))
 
-    def authenticate(self) -> MaestroResponse:
+    def token_refresh_in(self) -> float:
+        """Seconds until the cached token stops being used (0 if there is none or it has expired)."""
+        if not self._token:
+            return 0.0
+        return max(0.0, self._token_expires_at - self.token_skew - time.monotonic())
+
+    def _login_url(self) -> str:
+        return f"{self.base_url}/api/v2/workspace/login"
+
+    def _login_payload(self) -> Dict[str, str]:
+        return {"login": self.login_value, "key": self.key_value}
+
+    def _store_login(self, resp: Any) -> Dict[str, Any]:
         """
-        Perform authentication against Maestro login route and cache token & organization.
+        Validate a login response and cache its token & organization.
 
         Returns:
-            MaestroResponse with token and organization fields.
+            The parsed login payload.
 
         Raises:
             MaestroClientError on non-OK responses or malformed payloads.
         """
-        url = f"{self.base_url}/api/v2/workspace/login"
-        payload = {"login": self.login_value, "key": self.key_value}
-        resp = requests.post(url, json=payload, timeout=self.timeout)
-
-        if not resp.ok:
+        if resp.status_code >= 400:
             raise MaestroClientError(f"Authentication failed: {resp.status_code} {resp.text}")
 
         data = _safe_json(resp)
@@ -156,39 +165,294 @@ class MaestroClient:
         if not token or not organization:
             raise MaestroClientError(f"Invalid login response. Expected token & organization. Got: {data}")
 
+        self._token = token
+        self._organization = organization
+        # If the API returns an expiry value, use it here.
+        # The public examples do not show it; we assume 1 hour validity by default.
+        self._token_expires_at = time.monotonic() + 3600.0
+        self._apply_auth_headers()
+        return data
+
+    def _apply_auth_headers(self) -> None:
+        """Push the cached token & organization onto the underlying HTTP client's headers."""
+        self._update_http_headers({
+            "Authorization": f"Bearer {self._token}",
+            # Organization header (required by the API in many calls)
+            self.org_header_name: self._organization,
+        })
+
+    def _invalidate_token(self, rejected: Optional[str] = None) -> None:
+        """
+        Forget the cached token and drop it from the cached auth headers.
+
+        With `rejected` (the token a 401 was answered for), do nothing if the cached token
+        has changed since: another caller already logged in again and its token is still good.
+        """
+        if rejected is not None and rejected != self._token:
+            return
+        self._token_expires_at = 0.0
+        self._update_http_headers({"Authorization": None})
+
+    def _update_http_headers(self, changes: Mapping[str, Optional[str]]) -> None:
+        """
+        Set the given default headers of the underlying HTTP client (None drops a header).
+
+        The headers are rebuilt into a new mapping that replaces the old one in one assignment.
+        Requests in flight on other threads iterate the current mapping while merging it into
+        their own headers, so it is never mutated in place. On MaestroClient, callers hold the lock.
+        """
+        headers = CaseInsensitiveDict(self._http_headers())
+        for name, value in changes.items():
+            if value is None:
+                headers.pop(name, None)
+            else:
+                headers[name] = value
+        self._set_http_headers(headers)
+
+    @abstractmethod
+    def _http_headers(self) -> Mapping[str, str]:
+        """Return the default-headers mapping of the underlying HTTP client."""
+
+    @abstractmethod
+    def _set_http_headers(self, headers: Mapping[str, str]) -> None:
+        """Replace the default headers of the underlying HTTP client with `headers`."""
+
+    # ---------
+    # Retries
+    # ---------
+
+    @staticmethod
+    def _should_retry(method: str, status_code: int) -> bool:
+        """Return True if a response with this status is worth retrying for this method."""
+        if status_code in _RETRY_ALWAYS:
+            return True
+        return status_code in _RETRY_IDEMPOTENT and method in _IDEMPOTENT_METHODS
+
+    def _retry_delay(self, attempt: int, resp: Any) -> float:
+        """
+        Seconds to wait before retry number `attempt` (0-based).
+
+        Honors a numeric Retry-After header, capped at backoff_cap so a server can't
+        stall a caller for longer; otherwise exponential backoff with full jitter:
+        uniform(0, min(cap, base * 2**attempt)).
+        """
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(self.backoff_cap, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return random.random() * min(self.backoff_cap, self.backoff_base * 2 ** attempt)
+
+    def _resolve_url(self, path: str) -> str:
+        """
+        Ensure a valid absolute URL (memoized per client as _normalize_url):
+        - If 'path' already starts with http, return as-is.
+        - Else, resolve relative to <base_url>.
+          If it doesn't start with '/maestro/api', we prepend it.
+        """
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        if not path.startswith("/"):
+            path = "/" + path
+        if not path.startswith("/api/v2"):
+            path = "/api/v2" + path
+        return f"{self.base_url}{path}"
+
+    # -------------
+    # Utilities
+    # -------------
+
+    @property
+    def token(self) -> Optional[str]:
+        """Return the cached token (if any)."""
+        return self._token
+
+    @property
+    def organization(self) -> Optional[str]:
+        """Return the cached organization (if any)."""
+        return self._organization
+
+    # -----------------
+    # Resource helpers
+    # -----------------
+    # Built on first access and then kept on the instance, so a client only pays for
+    # the helpers it actually uses.
+
+    @functools.cached_property
+    def tasks(self) -> _TasksAPI:
+        return _TasksAPI(self)
+
+    @functools.cached_property
+    def logs(self) -> _LogsAPI:
+        return _LogsAPI(self)
+
+    @functools.cached_property
+    def automations(self) -> _AutomationsAPI:
+        return _AutomationsAPI(self)
+
+    @functools.cached_property
+    def bots(self) -> _BotsAPI:
+        return _BotsAPI(self)
+
+    @functools.cached_property
+    def runners(self) -> _RunnersAPI:
+        return _RunnersAPI(self)
+
+    @functools.cached_property
+    def credentials(self) -> _CredentialsAPI:
+        return _CredentialsAPI(self)
+
+    @functools.cached_property
+    def datapools(self) -> _DatapoolsAPI:
+        return _DatapoolsAPI(self)
+
+    @functools.cached_property
+    def result_files(self) -> _ResultFilesAPI:
+        return _ResultFilesAPI(self)
+
+    @functools.cached_property
+    def errors(self) -> _ErrorsAPI:
+        return _ErrorsAPI(self)
+
+    @functools.cached_property
+    def schedules(self) -> _SchedulesAPI:
+        return _SchedulesAPI(self)
+
+    @functools.cached_property
+    def workspaces(self) -> _WorkspacesAPI:
+        return _WorkspacesAPI(self)
+
+
+class MaestroClient(_BaseMaestroClient):
+    """
+    BotCity Maestro API client with token caching and organized resource helpers.
+
+    Typical usage:
+        client = MaestroClient(
+            login="your_login",
+            key="your_key",
+            base_url="https://developers.botcity.dev"
+        )
+
+        # Authenticate (auto-called on first request if needed)
+        client.authenticate()
+
+        # Use resource helpers
+        tasks = client.tasks.list(page=1, size=50)
+
+        # Or make arbitrary calls
+        resp = client.request_raw("GET", "/maestro/api/tasks", params={"page": 1, "size": 50})
+
+    Notes:
+        - Token & organization are retrieved by POST /maestro/api/login
+        - All subsequent requests use Authorization: Bearer <token>
+          and the X-Organization (or Organization) header when required by backend.
+        - Requests share one pooled requests.Session; call close() when done.
+        - Compression is negotiated by requests itself: it sends Accept-Encoding: gzip, deflate
+          (plus br/zstd when brotli/zstandard are installed) and decodes responses transparently.
+    """
+
+    def __init__(
+        self,
+        login: str,
+        key: str,
+        base_url: str = "https://developers.botcity.dev",
+        *,
+        request_timeout: float = 30.0,
+        token_skew: int = 10,
+        default_org_header: str = "X-Organization",
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
+    ):
+        """Arguments are documented on _BaseMaestroClient.__init__."""
+        super().__init__(
+            login,
+            key,
+            base_url,
+            request_timeout=request_timeout,
+            token_skew=token_skew,
+            default_org_header=default_org_header,
+            max_retries=max_retries,
+            backoff_base=backoff_base,
+            backoff_cap=backoff_cap,
+        )
+        # Re-entrant: authenticate() takes it while _ensure_authenticated() may already hold it.
+        self._lock = threading.RLock()
+
+        # One session for every call: keeps TCP/TLS connections alive between requests.
+        # Auth headers live on the session and are refreshed by authenticate().
+        self._session = requests.Session()
+        # Socket-level retries (refused/reset connections, read errors on idempotent methods)
+        # happen inside urllib3 and keep the pool warm. Status retries stay in request_raw.
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=2,
+            status=0,
+            backoff_factor=0.3,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # No session-wide Content-Type: requests sets it per body (JSON or multipart boundary).
+
+    def _http_headers(self) -> Mapping[str, str]:
+        return self._session.headers
+
+    def _set_http_headers(self, headers: Mapping[str, str]) -> None:
+        self._session.headers = headers
+
+    # --------
+    # Auth
+    # --------
+
+    def authenticate(self) -> MaestroResponse:
+        """
+        Perform authentication against Maestro login route and cache token & organization.
+
+        Returns:
+            MaestroResponse with token and organization fields.
+
+        Raises:
+            MaestroClientError on non-OK responses or malformed payloads.
+        """
+        url = self._login_url()
+        resp = self._session.post(url, json=self._login_payload(), timeout=self.timeout)
+
         with self._lock:
-            self._token = token
-            self._organization = organization
-            # If the API returns an expiry value, use it here.
-            # The public examples do not show it; we assume 1 hour validity by default.
-            self._token_expires_at = time.time() + 3600.0
+            data = self._store_login(resp)
 
         return MaestroResponse(
             ok=True,
             status_code=resp.status_code,
             url=url,
-            headers=dict(resp.headers),
+            headers=resp.headers,
             data=data,
             raw=resp
         )
 
-    def _auth_headers(self) -> Dict[str, str]:
+    def refresh(self) -> MaestroResponse:
+        """Log in again now, serialized with the on-demand login of concurrent requests."""
+        with self._lock:
+            return self.authenticate()
+
+    def _ensure_authenticated(self) -> None:
         """
-        Build Authorization headers. Re-auth if token is absent/expired.
+        Re-auth if token is absent/expired, so the session carries valid auth headers.
+
+        The common case (valid token) is checked without the lock; only a refresh
+        takes it, re-checking first in case another thread just re-authenticated.
         """
+        if self._is_token_valid():
+            return
         with self._lock:
             if not self._is_token_valid():
                 self.authenticate()
 
-            headers = {
-                "Authorization": f"Bearer {self._token}",
-                "Content-Type": "application/json",
-            }
-            # Organization header (required by the API in many calls)
-            if self._organization:
-                headers[self.org_header_name] = self._organization
-            return headers
-
     # ---------------
     # Core requestor
     # ---------------
@@ -201,6 +465,7 @@ class MaestroClient:
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         retry_on_401: bool = True,
         stream: bool = False,
@@ -214,79 +479,69 @@ class MaestroClient:
             params: Querystring parameters.
             json: JSON body.
             files: Files dict for multipart/form-data.
-            headers: Additional headers (merged with auth headers).
+            data: Form fields, sent with `files` in the same multipart body.
+            headers: Additional headers (merged with the session's auth headers).
             retry_on_401: If True, on 401 the client will re-auth and retry once.
-            stream: If True, return the Response with streaming content.
+            stream: If True, the body is not read: `data` is None and the caller consumes
+                `raw.iter_content(...)` and must `raw.close()` when done.
+
+        Transient 429/5xx responses are retried up to `max_retries` times with
+        exponential backoff and full jitter (see _should_retry / _retry_delay).
 
         Returns:
             MaestroResponse
         """
+        method = method.upper()
         url = self._normalize_url(path)
-        base_headers = self._auth_headers()
-        if headers:
-            base_headers.update(headers)
+        self._ensure_authenticated()
+        token = self._token
 
-        resp = requests.request(
-            method=method.upper(),
-            url=url,
-            headers=base_headers,
-            params=params,
-            json=json if files is None else None,
-            files=files,
-            timeout=self.timeout,
-            stream=stream
-        )
+        # Serialize a JSON body once; retries and the 401 resend reuse the same bytes.
+        if json is not None and files is None and data is None:
+            data = _dump_json(json)
+            headers = {"Content-Type": "application/json", **(headers or {})}
 
-        # If unauthorized, try to refresh token once and retry.
-        if resp.status_code == 401 and retry_on_401:
-            with self._lock:
-                # Force a new token
-                self.authenticate()
-            base_headers = self._auth_headers()
-            if headers:
-                base_headers.update(headers)
-            resp = requests.request(
-                method=method.upper(),
+        def send() -> requests.Response:
+            return self._session.request(
+                method=method,
                 url=url,
-                headers=base_headers,
+                headers=headers,
                 params=params,
-                json=json if files is None else None,
                 files=files,
+                data=data,
                 timeout=self.timeout,
                 stream=stream
             )
 
-        return _wrap_response(resp)
+        resp = self._send_with_backoff(method, send)
 
-    def _normalize_url(self, path: str) -> str:
-        """
-        Ensure a valid absolute URL:
-        - If 'path' already starts with http, return as-is.
-        - Else, resolve relative to <base_url>.
-          If it doesn't start with '/maestro/api', we prepend it.
-        """
-        if path.startswith("http://") or path.startswith("https://"):
-            return path
-        if not path.startswith("/"):
-            path = "/" + path
-        if not path.startswith("/api/v2"):
-            path = "/api/v2" + path
-        return f"{self.base_url}{path}"
+        # If unauthorized, try to refresh token once and retry.
+        if resp.status_code == 401 and retry_on_401:
+            resp.close()
+            # Force a new token, unless a concurrent request already replaced the rejected one.
+            with self._lock:
+                self._invalidate_token(token)
+                self._ensure_authenticated()
+            resp = self._send_with_backoff(method, send)
+
+        return _wrap_response(resp, stream=stream)
+
+    def _send_with_backoff(self, method: str, send) -> requests.Response:
+        """Call `send()` and retry transient failures, sleeping between attempts."""
+        resp = send()
+        for attempt in range(self.max_retries):
+            if not self._should_retry(method, resp.status_code):
+                break
+            delay = self._retry_delay(attempt, resp)
+            resp.close()
+            time.sleep(delay)
+            resp = send()
+        return resp
 
     # -------------
     # Utilities
     # -------------
 
-    @property
-    def token(self) -> Optional[str]:
-        """Return the cached token (if any)."""
-        return self._token
-
-    @property
-    def organization(self) -> Optional[str]:
-        """Return the cached organization (if any)."""
-        return self._organization
-
     def set_organization(self, organization: str) -> None:
         """
         Manually override the cached organization header value.
@@ -296,6 +551,20 @@ class MaestroClient:
         """
         with self._lock:
             self._organization = organization
+            self._update_http_headers({self.org_header_name: organization})
+
+    def gather(self, calls: Iterable[MaestroResponse]) -> list[MaestroResponse]:
+        """
+        Collect the results of several helper calls, in order.
+
+        Calls run one after another here; AsyncMaestroClient.gather runs them concurrently,
+        so helpers such as tasks.get_many work with either client.
+        """
+        return list(calls)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
 
 # ------------------------
@@ -314,34 +583,40 @@ class _TasksAPI:
       - POST /tasks/{taskId}/restart
     """
 
+    _base = "/api/v2/task"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
     def list(self, **kwargs) -> MaestroResponse:
         """GET /tasks"""
-        query_params = "&".join(f"{k}={v}" for k, v in kwargs.items() if v is not None)
-        return self._c.request_raw("GET", f"/api/v2/task?{query_params}")
+        params = {k: v for k, v in kwargs.items() if v is not None}
+        return self._c.request_raw("GET", self._base, params=params)
 
     def create(self, automation_label: str, data: Dict[str, Any]) -> MaestroResponse:
         """POST /tasks"""
         payload = {"automationLabel": automation_label, "data": data}
-        return self._c.request_raw("POST", "/api/v2/task", json=payload)
+        return self._c.request_raw("POST", self._base, json=payload)
 
     def get(self, task_id: Union[str, int]) -> MaestroResponse:
         """GET /tasks/{taskId}"""
-        return self._c.request_raw("GET", f"/api/v2/task/{task_id}")
+        return self._c.request_raw("GET", f"{self._base}/{task_id}")
+
+    def get_many(self, task_ids: Iterable[Union[str, int]]) -> list[MaestroResponse]:
+        """GET /tasks/{taskId} for each id; concurrent with AsyncMaestroClient."""
+        return self._c.gather(self.get(task_id) for task_id in task_ids)
 
     def cancel(self, task_id: Union[str, int]) -> MaestroResponse:
         """POST /tasks/{taskId}/cancel"""
-        return self._c.request_raw("POST", f"/api/v2/task/{task_id}/cancel")
+        return self._c.request_raw("POST", f"{self._base}/{task_id}/cancel")
 
     def finish(self, task_id: Union[str, int], result: Optional[Dict[str, Any]] = None) -> MaestroResponse:
         """POST /tasks/{taskId}/finish"""
-        return self._c.request_raw("POST", f"/api/v2/task/{task_id}/finish", json=result or {})
+        return self._c.request_raw("POST", f"{self._base}/{task_id}/finish", json=result or {})
 
     def restart(self, task_id: Union[str, int]) -> MaestroResponse:
         """POST /tasks/{taskId}/restart"""
-        return self._c.request_raw("POST", f"/api/v2/task/{task_id}/restart")
+        return self._c.request_raw("POST", f"{self._base}/{task_id}/restart")
 
 
 class _LogsAPI:
@@ -354,6 +629,8 @@ class _LogsAPI:
       - GET /logs/{logId}/download
     """
 
+    _base = "/maestro/api/logs"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -361,7 +638,7 @@ class _LogsAPI:
         """POST /logs"""
         payload = {"label": label, "message": message, "level": level}
         payload.update(kwargs)
-        return self._c.request_raw("POST", "/maestro/api/logs", json=payload)
+        return self._c.request_raw("POST", self._base, json=payload)
 
     def list(self, *, label: Optional[str] = None, page: int = 1, size: int = 50,
              extra: Optional[Dict[str, Any]] = None) -> MaestroResponse:
@@ -371,20 +648,24 @@ class _LogsAPI:
             params["label"] = label
         if extra:
             params.update(extra)
-        return self._c.request_raw("GET", "/maestro/api/logs", params=params)
+        return self._c.request_raw("GET", self._base, params=params)
 
     def get(self, log_id: Union[str, int]) -> MaestroResponse:
         """GET /logs/{logId}"""
-        return self._c.request_raw("GET", f"/maestro/api/logs/{log_id}")
+        return self._c.request_raw("GET", f"{self._base}/{log_id}")
 
     def delete(self, log_id: Union[str, int]) -> MaestroResponse:
         """DELETE /logs/{logId}"""
-        return self._c.request_raw("DELETE", f"/maestro/api/logs/{log_id}")
+        return self._c.request_raw("DELETE", f"{self._base}/{log_id}")
 
-    def download(self, log_id: Union[str, int]) -> MaestroResponse:
-        """GET /logs/{logId}/download"""
-        # stream not necessary unless huge; keeping simple.
-        return self._c.request_raw("GET", f"/maestro/api/logs/{log_id}/download")
+    def download(self, log_id: Union[str, int], stream: bool = False) -> MaestroResponse:
+        """
+        GET /logs/{logId}/download
+
+        With stream=True the body is left unread (see request_raw) so large logs can be
+        written out in chunks instead of being held in memory.
+        """
+        return self._c.request_raw("GET", f"{self._base}/{log_id}/download", stream=stream)
 
 
 class _AutomationsAPI:
@@ -395,6 +676,8 @@ class _AutomationsAPI:
       - (Sometimes create/update via bots upload or CI/CD – kept generic)
     """
 
+    _base = "/api/v2/activity"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -406,11 +689,11 @@ class _AutomationsAPI:
             params["label"] = label
         if extra:
             params.update(extra)
-        return self._c.request_raw("GET", "/api/v2/activity", params=params)
+        return self._c.request_raw("GET", self._base, params=params)
 
     def get(self, automation_label:str) -> MaestroResponse:
         """GET /automations/{id}"""
-        return self._c.request_raw("GET", f"/api/v2/activity/{automation_label}")
+        return self._c.request_raw("GET", f"{self._base}/{automation_label}")
 
 
 class _BotsAPI:
@@ -423,6 +706,8 @@ class _BotsAPI:
       - Optional routes: /bots/{botId}/release etc., depending on workspace features
     """
 
+    _base = "/api/v2/bot"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -431,11 +716,11 @@ class _BotsAPI:
         params = {"page": page, "size": size}
         if extra:
             params.update(extra)
-        return self._c.request_raw("GET", "/api/v2/bot", params=params)
+        return self._c.request_raw("GET", self._base, params=params)
 
     def get(self, bot_id:str, bot_version:str) -> MaestroResponse:
         """GET /bots/{botId}"""
-        return self._c.request_raw("GET", f"/api/v2/bot/{bot_id}/version/{bot_version}")
+        return self._c.request_raw("GET", f"{self._base}/{bot_id}/version/{bot_version}")
 
     def create(self, *, label: str, repository: Optional[str] = None, **kwargs) -> MaestroResponse:
         """POST /bots"""
@@ -443,15 +728,15 @@ class _BotsAPI:
         if repository:
             payload["repository"] = repository
         payload.update(kwargs)
-        return self._c.request_raw("POST", "/api/v2/bot", json=payload)
+        return self._c.request_raw("POST", self._base, json=payload)
 
     def update(self, bot_id: Union[str, int], **fields) -> MaestroResponse:
         """PUT /bots/{botId}"""
-        return self._c.request_raw("PUT", f"/api/v2/bot/{bot_id}", json=fields)
+        return self._c.request_raw("PUT", f"{self._base}/{bot_id}", json=fields)
 
     def release(self, bot_id: Union[str, int], **fields) -> MaestroResponse:
         """POST /bots/{botId}/release (if supported)"""
-        return self._c.request_raw("POST", f"/api/v2/bot/{bot_id}/release", json=fields)
+        return self._c.request_raw("POST", f"{self._base}/{bot_id}/release", json=fields)
 
 
 class _RunnersAPI:
@@ -462,20 +747,22 @@ class _RunnersAPI:
       - (actions may exist such as attach/release via Session Manager; keep generic endpoints)
     """
 
+    _base = "/api/v2/machine"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
     def get_info(self, runner_id: Union[str, int]) -> MaestroResponse:
         """GET /runners/{runnerId}"""
-        return self._c.request_raw("GET", f"/api/v2/machine/{runner_id}")
+        return self._c.request_raw("GET", f"{self._base}/{runner_id}")
 
     def get_log(self, runner_id: Union[str, int]) -> MaestroResponse:
         """GET /runners/{runnerId}"""
-        return self._c.request_raw("GET", f"/api/v2/machine/log/{runner_id}")
+        return self._c.request_raw("GET", f"{self._base}/log/{runner_id}")
     
     def get_tasks_summary(self, runner_id: Union[str, int]) -> MaestroResponse:
         """GET /runners/{runnerId}"""
-        return self._c.request_raw("GET", f"/api/v2/machine/{runner_id}/tasks-summary?days=30")
+        return self._c.request_raw("GET", f"{self._base}/{runner_id}/tasks-summary?days=30")
     
 
 class _CredentialsAPI:
@@ -489,6 +776,8 @@ class _CredentialsAPI:
       - GET /credentials/{label}/{key}  (common pattern for key retrieval)
     """
 
+    _base = "/api/v2/credential"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -497,15 +786,15 @@ class _CredentialsAPI:
         params = {"page": page, "size": size}
         if extra:
             params.update(extra)
-        return self._c.request_raw("GET", "/api/v2/credential", params=params)
+        return self._c.request_raw("GET", self._base, params=params)
 
     def get(self, credential_id: Union[str, int]) -> MaestroResponse:
         """GET /credentials/{id}"""
-        return self._c.request_raw("GET", f"/api/v2/credential/{credential_id}")
+        return self._c.request_raw("GET", f"{self._base}/{credential_id}")
 
     def get_key(self, credential_id:str, credential_key:str) -> MaestroResponse:
         """GET /credentials/{id}"""
-        return self._c.request_raw("GET", f"/api/v2/credential/{credential_id}/key/{credential_key}")
+        return self._c.request_raw("GET", f"{self._base}/{credential_id}/key/{credential_key}")
     
     def create(self, label:str, values:Dict[str, Any], repository_label:str="DEFAULT", **kwargs) -> MaestroResponse:
         """
@@ -524,7 +813,7 @@ class _CredentialsAPI:
             "secrets": secrets
         }
         payload.update(kwargs)
-        return self._c.request_raw("POST", "/api/v2/credential", json=payload)
+        return self._c.request_raw("POST", self._base, json=payload)
 
 
 class _DatapoolsAPI:
@@ -537,6 +826,8 @@ class _DatapoolsAPI:
       - DELETE /datapools/{label}/items/{itemId}
     """
 
+    _base = "/api/v2/datapool"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -545,22 +836,22 @@ class _DatapoolsAPI:
         params = {"page": page, "size": size}
         if extra:
             params.update(extra)
-        return self._c.request_raw("GET", "/api/v2/datapool", params=params)
+        return self._c.request_raw("GET", self._base, params=params)
     
     def get(self, datapool_label:str) -> MaestroResponse:
-        return self._c.request_raw("GET", f"/api/v2/datapool/{datapool_label}")
+        return self._c.request_raw("GET", f"{self._base}/{datapool_label}")
 
     def view(self, datapool_label:str) -> MaestroResponse:
-        return self._c.request_raw("GET", f"/api/v2/datapool/{datapool_label}/view")
+        return self._c.request_raw("GET", f"{self._base}/{datapool_label}/view")
     
     def summary(self, datapool_label:str) -> MaestroResponse:
-        return self._c.request_raw("GET", f"/api/v2/datapool/{datapool_label}/summary")
+        return self._c.request_raw("GET", f"{self._base}/{datapool_label}/summary")
     
     def create(self, **kwargs) -> MaestroResponse:
-        return self._c.request_raw("POST", f"/api/v2/datapool", json=kwargs)
+        return self._c.request_raw("POST", self._base, json=kwargs)
     
     def add_item(self, datapool_label:str, **kwargs) -> MaestroResponse:
-        return self._c.request_raw("POST", f"/api/v2/datapool/{datapool_label}/push", json=kwargs)
+        return self._c.request_raw("POST", f"{self._base}/{datapool_label}/push", json=kwargs)
 
 
 class _ResultFilesAPI:
@@ -569,10 +860,12 @@ class _ResultFilesAPI:
       - GET /artifacts
       - GET /artifacts/{artifactId}
       - GET /artifacts/{artifactId}/download
-      - POST /artifacts (multipart/form-data)
+      - POST /artifacts/{artifactId}/file (multipart/form-data)
       - DELETE /artifacts/{artifactId}
     """
 
+    _base = "/api/v2/artifact"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -582,15 +875,41 @@ class _ResultFilesAPI:
         if kwargs:
             kwargs_query_string = "&" + "&".join(f"{k}={v}" for k, v in kwargs.items() if v is not None)
 
-        return self._c.request_raw("GET", f"/api/v2/artifact?size={size}&page={page}{kwargs_query_string}")
+        return self._c.request_raw("GET", f"{self._base}?size={size}&page={page}{kwargs_query_string}")
 
     def get(self, artifact_id: Union[str, int]) -> MaestroResponse:
         """GET /artifacts/{artifactId}"""
-        return self._c.request_raw("GET", f"/api/v2/artifact/{artifact_id}")
+        return self._c.request_raw("GET", f"{self._base}/{artifact_id}")
 
-    def get_file(self, artifact_id: Union[str, int]) -> MaestroResponse:
-        """GET /artifacts/{artifactId}/download"""
-        return self._c.request_raw("GET", f"/api/v2/artifact/{artifact_id}/file")
+    def get_file(self, artifact_id: Union[str, int], stream: bool = False) -> MaestroResponse:
+        """
+        GET /artifacts/{artifactId}/download
+
+        With stream=True the body is left unread (see request_raw) so large artifacts can be
+        written out in chunks instead of being held in memory.
+        """
+        return self._c.request_raw("GET", f"{self._base}/{artifact_id}/file", stream=stream)
+
+    def upload(
+        self,
+        artifact_id: Union[str, int],
+        file: Any,
+        filename: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> MaestroResponse:
+        """
+        POST /artifacts/{artifactId}/file (multipart/form-data)
+
+        `file` may be bytes or an open binary file; pass bytes if the call may need to be
+        retried, since a file object is consumed by the first attempt. `meta` is sent as
+        extra form fields of the same request.
+        """
+        if filename is None:
+            # An open file's name is the path it was opened with; send only its last component.
+            name = getattr(file, "name", None)
+            filename = os.path.basename(name) if isinstance(name, str) else "file"
+        files = {"file": (filename, file)}
+        return self._c.request_raw("POST", f"{self._base}/{artifact_id}/file", files=files, data=meta)
 
 
 class _ErrorsAPI:
@@ -601,6 +920,8 @@ class _ErrorsAPI:
       - DELETE /errors/{errorId}
     """
 
+    _base = "/api/v2/error"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -609,14 +930,14 @@ class _ErrorsAPI:
         params = {"page": page, "size": size}
         if extra:
             params.update(extra)
-        return self._c.request_raw("GET", "/api/v2/error", params=params)
+        return self._c.request_raw("GET", self._base, params=params)
 
     def get(self, error_id: Union[str, int]) -> MaestroResponse:
         """GET /errors/{errorId}"""
-        return self._c.request_raw("GET", f"/api/v2/error/{error_id}")
+        return self._c.request_raw("GET", f"{self._base}/{error_id}")
 
     def get_by_automation(self, automation_label:str) -> MaestroResponse:
-        return self._c.request_raw("GET", f"/api/v2/error?AutomationLabel={automation_label}&days=30")
+        return self._c.request_raw("GET", f"{self._base}?AutomationLabel={automation_label}&days=30")
 
 
 class _SchedulesAPI:
@@ -629,6 +950,8 @@ class _SchedulesAPI:
       - DELETE /schedules/{id}
     """
 
+    _base = "/api/v2/scheduling"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -637,23 +960,23 @@ class _SchedulesAPI:
         params = {"page": page, "size": size}
         if extra:
             params.update(extra)
-        return self._c.request_raw("GET", "/api/v2/scheduling", params=params)
+        return self._c.request_raw("GET", self._base, params=params)
 
     def get(self, schedule_id: Union[str, int]) -> MaestroResponse:
         """GET /schedules/{id}"""
-        return self._c.request_raw("GET", f"/api/v2/scheduling/{schedule_id}")
+        return self._c.request_raw("GET", f"{self._base}/{schedule_id}")
 
     def create(self, **fields) -> MaestroResponse:
         """POST /schedules"""
-        return self._c.request_raw("POST", "/api/v2/scheduling", json=fields)
+        return self._c.request_raw("POST", self._base, json=fields)
 
     def update(self, schedule_id: Union[str, int], **fields) -> MaestroResponse:
         """PUT /schedules/{id}"""
-        return self._c.request_raw("PUT", f"/api/v2/scheduling/{schedule_id}", json=fields)
+        return self._c.request_raw("PUT", f"{self._base}/{schedule_id}", json=fields)
 
     def delete(self, schedule_id: Union[str, int]) -> MaestroResponse:
         """DELETE /schedules/{id}"""
-        return self._c.request_raw("DELETE", f"/api/v2/scheduling/{schedule_id}")
+        return self._c.request_raw("DELETE", f"{self._base}/{schedule_id}")
 
 
 class _WorkspacesAPI:
@@ -663,6 +986,8 @@ class _WorkspacesAPI:
       - GET /workspaces/{id}
     """
 
+    _base = "/maestro/api/workspaces"
+
     def __init__(self, client: MaestroClient):
         self._c = client
 
@@ -671,29 +996,40 @@ class _WorkspacesAPI:
         params = {"page": page, "size": size}
         if extra:
             params.update(extra)
-        return self._c.request_raw("GET", "/maestro/api/workspaces", params=params)
+        return self._c.request_raw("GET", self._base, params=params)
 
     def get(self, workspace_id: Union[str, int]) -> MaestroResponse:
         """GET /workspaces/{id}"""
-        return self._c.request_raw("GET", f"/maestro/api/workspaces/{workspace_id}")
+        return self._c.request_raw("GET", f"{self._base}/{workspace_id}")
 
 
 # ----------------
 # Helper functions
 # ----------------
 
+def _dump_json(obj: Any) -> bytes:
+    """Serialize a request body to JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 def _safe_json(resp: requests.Response) -> Dict[str, Any]:
     """Try parsing JSON; return empty dict on failure."""
+    # Parse the body bytes directly rather than via resp.json(), which decodes them to str first.
     try:
-        return resp.json()
+        if orjson is not None:
+            return orjson.loads(resp.content)
+        return json.loads(resp.content)
     except Exception:
         return {}
 
-def _wrap_response(resp: requests.Response) -> MaestroResponse:
-    """Build a MaestroResponse from a requests.Response."""
+def _wrap_response(resp: requests.Response, stream: bool = False) -> MaestroResponse:
+    """Build a MaestroResponse from a requests/httpx Response; stream=True leaves the body unread."""
     data: Any
     ctype = resp.headers.get("Content-Type", "")
-    if "application/json" in ctype:
+    if stream:
+        data = None
+    elif "application/json" in ctype:
         data = _safe_json(resp)
     else:
         # If content is text, get .text; else raw bytes
@@ -706,10 +1042,11 @@ def _wrap_response(resp: requests.Response) -> MaestroResponse:
             data = resp.content
 
     return MaestroResponse(
-        ok=resp.ok,
+        # Same as resp.ok, without raising and catching HTTPError inside raise_for_status()
+        ok=resp.status_code < 400,
         status_code=resp.status_code,
         url=str(resp.url),
-        headers=dict(resp.headers),
+        headers=resp.headers,
         data=data,
         raw=resp
     )
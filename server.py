@@ -1,22 +1,81 @@
+import asyncio
+import contextlib
+import logging
 import os
 
+import uvicorn
+
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastmcp import FastMCP
-from maestro_client import MaestroClient
+from maestro_client import AsyncMaestroClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
 
 load_dotenv()
 
-mcp = FastMCP("Bots")
-client = MaestroClient(
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before trying again when a background login fails.
+TOKEN_RETRY_DELAY = 30.0
+
+client = AsyncMaestroClient(
     login=os.getenv("LOGIN"),
     key=os.getenv("KEY"),
 )
 
-@mcp.tool
-def list_tasks() -> dict:
+
+async def keep_token_fresh():
+    """Log in at startup and again just before each token expires, so tool calls never wait on it."""
+    while True:
+        try:
+            await client.refresh()
+            delay = client.token_refresh_in() or TOKEN_RETRY_DELAY
+        except Exception:
+            # Tool calls still log in on demand; try again in the background shortly.
+            delay = TOKEN_RETRY_DELAY
+            logger.warning("Background Maestro login failed; retrying in %.0fs", delay, exc_info=True)
+        await asyncio.sleep(delay)
+
+
+# Reported as serverInfo.version. Clients key their cached tool list on it, so bump it
+# whenever a tool is added, removed or changes its signature.
+SERVER_VERSION = "1.0.0"
+
+mcp = FastMCP("Bots", version=SERVER_VERSION)
+
+@mcp.tool(annotations={"readOnlyHint": True})
+async def list_tasks() -> dict:
     """List Botcity tasks."""
-    return client.tasks.list().data
+    return (await client.tasks.list()).data
+
+
+@mcp.tool(annotations={"readOnlyHint": True})
+async def get_tasks(task_ids: list[str]) -> list:
+    """Get several Botcity tasks by id in one call."""
+    return [resp.data for resp in await client.tasks.get_many(task_ids)]
+
+
+mcp_app = mcp.http_app()
+
+
+@asynccontextmanager
+async def app_lifespan(app: Starlette):
+    # FastMCP's own lifespan runs once per MCP session; the client's connection pool and
+    # its token refresher are shared by every session, so they live as long as the app.
+    async with mcp_app.router.lifespan_context(app):
+        refresher = asyncio.create_task(keep_token_fresh())
+        try:
+            yield
+        finally:
+            refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresher
+            await client.aclose()
+
+
+app = Starlette(routes=[Mount("/", app=mcp_app)], lifespan=app_lifespan)
 
 
 if __name__ == "__main__":
-    mcp.run(transport="streamable-http", port=8000)
+    uvicorn.run(app, host="127.0.0.1", port=8000)
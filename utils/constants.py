@@ -1,2 +1,29 @@
+import importlib.util
+
 MCP_SERVER_URL = "http://localhost:8000/mcp"
-OLLAMA_BASE_URL = "http://localhost:11434"
\ No newline at end of file
+OLLAMA_BASE_URL = "http://localhost:11434"
+
+# Cache for read-only MCP tool results (seconds / entries)
+TOOL_CACHE_TTL = 60.0
+TOOL_CACHE_MAXSIZE = 256
+
+# Worker threads for blocking work offloaded from the client event loop
+TOOL_EXECUTOR_WORKERS = 8
+
+# Connection pool limits for the MCP streamable-http transport
+MCP_HTTP_MAX_CONNECTIONS = 50
+MCP_HTTP_MAX_KEEPALIVE = 20
+
+# httpx and httpx2 only negotiate HTTP/2 when the optional `h2` package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# How long the on-disk copy of the server's tool list stays valid (seconds)
+TOOL_CATALOG_TTL = 3600.0
+
+# Ollama chat model: 4-bit quantized llama3.1 (tool-calling capable), kept loaded between steps
+OLLAMA_MODEL = "llama3.1:8b-instruct-q4_K_M"
+OLLAMA_KEEP_ALIVE = "30m"
+OLLAMA_NUM_CTX = 4096
+
+# Exact-match LLM response cache (SQLite file path); None disables it
+LLM_CACHE_PATH = None
@@ -0,0 +1,61 @@
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Any
+
+import httpx2
+from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
+
+from utils.constants import HTTP2_AVAILABLE, MCP_HTTP_MAX_CONNECTIONS, MCP_HTTP_MAX_KEEPALIVE
+
+
+def http_client_factory(
+    headers: dict[str, str] | None = None,
+    timeout: httpx2.Timeout | None = None,
+    auth: httpx2.Auth | None = None,
+    **kwargs: Any,
+) -> httpx2.AsyncClient:
+    """Build the httpx2 client backing a streamable-http MCP session, with explicit pool limits.
+
+    Other client options the transport passes (fastmcp sets follow_redirects=True) are
+    forwarded to httpx2.AsyncClient as given.
+    """
+    return httpx2.AsyncClient(
+        headers=headers,
+        timeout=timeout if timeout is not None else httpx2.Timeout(30.0, read=300.0),
+        auth=auth,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx2.Limits(
+            max_connections=MCP_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=MCP_HTTP_MAX_KEEPALIVE,
+        ),
+        **kwargs,
+    )
+
+
+class MCPSessionPool:
+    """Keeps one connected MCP client per server URL for the lifetime of the pool."""
+
+    def __init__(self):
+        self._clients: dict[str, Client] = {}
+        self._stack = AsyncExitStack()
+        self._lock = asyncio.Lock()
+
+    async def get(self, url: str) -> Client:
+        """Return the connected client for `url`, opening the session on first use."""
+        client = self._clients.get(url)
+        if client is not None:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(url)
+            if client is None:
+                transport = StreamableHttpTransport(url, httpx_client_factory=http_client_factory)
+                client = await self._stack.enter_async_context(Client(transport))
+                self._clients[url] = client
+            return client
+
+    async def aclose(self) -> None:
+        """Close every pooled session."""
+        self._clients.clear()
+        await self._stack.aclose()
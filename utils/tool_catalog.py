@@ -0,0 +1,57 @@
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from mcp.types import Tool
+
+from utils.json_codec import dumps, loads
+
+CATALOG_PATH = Path.home() / ".cache" / "fastmcp" / "tools.json"
+
+
+def _catalog_key(url: str, server_version: Optional[str]) -> str:
+    return f"{url}|{server_version or ''}"
+
+
+def _read_catalog() -> dict:
+    try:
+        return loads(CATALOG_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def load_cached_tools(url: str, server_version: Optional[str], ttl: float) -> Optional[List[Tool]]:
+    """Return the cached tool list for this server, or None if missing, stale or unreadable."""
+    entry = _read_catalog().get(_catalog_key(url, server_version))
+    if not entry or time.time() - entry.get("fetched_at", 0) > ttl:
+        return None
+    try:
+        return [Tool.model_validate(t) for t in entry["tools"]]
+    except (KeyError, ValueError):
+        return None
+
+
+def save_cached_tools(url: str, server_version: Optional[str], tools: List[Tool]) -> None:
+    """Persist the tool list for this server; failures to write are ignored."""
+    catalog = _read_catalog()
+    catalog[_catalog_key(url, server_version)] = {
+        "fetched_at": time.time(),
+        "tools": [t.model_dump(mode="json", by_alias=True, exclude_none=True) for t in tools],
+    }
+    try:
+        CATALOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CATALOG_PATH.write_bytes(dumps(catalog))
+    except OSError:
+        pass
+
+
+async def list_tools_cached(mcp, url: str, ttl: float) -> List[Tool]:
+    """List the server's tools, skipping the round trip while the on-disk copy is fresh."""
+    # server_info is filled in on every protocol era (initialize_result is None under server/discover).
+    server_info = mcp.server_info
+    server_version = server_info.version if server_info is not None else None
+    tools = load_cached_tools(url, server_version, ttl)
+    if tools is None:
+        tools = await mcp.list_tools()
+        save_cached_tools(url, server_version, tools)
+    return tools